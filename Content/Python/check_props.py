@@ -3,11 +3,12 @@ import unreal
 editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
 all_actors = editor_actor_subsystem.get_all_level_actors()
 
-prop_count = 0
-for actor in all_actors:
-    if actor.get_actor_label().startswith("Prop_"):
-        prop_count += 1
+def _collect_labels(actors):
+    """Fetch every actor label in one C++ call instead of one call per actor"""
+    return unreal.SpecialAgentScriptLibrary.get_actor_labels(actors)
+
+labels = _collect_labels(all_actors)
+prop_count = sum(1 for lbl in labels if lbl.startswith("Prop_"))
         
 print(f"Found {prop_count} newly placed props")
 unreal.log(f"Found {prop_count} newly placed props")
-
@@ -3,42 +3,79 @@ Example: Find and list actors by type
 Demonstrates world introspection via Python
 """
 
+import sys
 import unreal
+from collections import Counter
 
-def find_actors_by_type(actor_class_name: str = None):
+editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+
+def _resolve_actor_class(actor_class_name: str):
+    """
+    Look up an actor class by name
+    
+    Args:
+        actor_class_name: Name of the actor class (e.g., "StaticMeshActor")
+    
+    Returns:
+        The class, or None if no Actor class with that name could be found
+    """
+    actor_class = getattr(unreal, actor_class_name, None)
+    if isinstance(actor_class, type) and issubclass(actor_class, unreal.Actor):
+        return actor_class
+    
+    # Non-Actor classes (e.g., "StaticMesh") can't go to by_class - let the caller fall back.
+    # find_object only looks at loaded classes, so unknown names don't log a load warning
+    actor_class = unreal.find_object(None, f"/Script/Engine.{actor_class_name}")
+    if actor_class and unreal.MathLibrary.class_is_child_of(actor_class, unreal.Actor):
+        return actor_class
+    return None
+
+def find_actors_by_type(actor_class_name: str = None, top_n: int = None):
     """
     Find all actors of a specific type in the current level
     
     Args:
-        actor_class_name: Name of the actor class (e.g., "StaticMeshActor", "PointLight")
+        actor_class_name: Name of the actor class (e.g., "StaticMeshActor", "PointLight").
+            A name that resolves to an Actor class matches that class and its subclasses;
+            any other name is matched as a substring of each actor's class name
+        top_n: Only show the N most common types in the breakdown (default: show all)
     """
-    editor_level_lib = unreal.EditorLevelLibrary()
-    all_actors = editor_level_lib.get_all_level_actors()
+    all_actors = editor_actor_subsystem.get_all_level_actors()
     
     print(f"Total actors in level: {len(all_actors)}")
     
     if actor_class_name:
-        # Filter by class
-        filtered_actors = [a for a in all_actors if actor_class_name in a.get_class().get_name()]
+        # Filter by class - resolved once, then type-checked in C++ (includes subclasses)
+        actor_class = _resolve_actor_class(actor_class_name)
+        if actor_class:
+            filtered_actors = unreal.EditorFilterLibrary.by_class(all_actors, actor_class)
+        else:
+            # Unknown class name - fall back to matching it against part of each class name
+            class_names = unreal.SpecialAgentScriptLibrary.get_actor_class_names(all_actors)
+            filtered_actors = [a for a, class_name in zip(all_actors, class_names) if actor_class_name in class_name]
         print(f"\nActors of type '{actor_class_name}': {len(filtered_actors)}")
         
+        lines = []
         for i, actor in enumerate(filtered_actors[:20]):  # Show first 20
             location = actor.get_actor_location()
-            print(f"  {i+1}. {actor.get_actor_label()}")
-            print(f"     Location: X={location.x:.1f}, Y={location.y:.1f}, Z={location.z:.1f}")
+            lines.append(f"  {i+1}. {actor.get_actor_label()}")
+            lines.append(f"     Location: X={location.x:.1f}, Y={location.y:.1f}, Z={location.z:.1f}")
         
         if len(filtered_actors) > 20:
-            print(f"  ... and {len(filtered_actors) - 20} more")
+            lines.append(f"  ... and {len(filtered_actors) - 20} more")
+        sys.stdout.write("".join(line + "\n" for line in lines))
     else:
         # Show breakdown by type
         print("\nActor breakdown by type:")
-        type_counts = {}
-        for actor in all_actors:
-            class_name = actor.get_class().get_name()
-            type_counts[class_name] = type_counts.get(class_name, 0) + 1
+        # Fetch every class name in one call rather than get_class().get_name() per actor
+        type_counts = Counter(unreal.SpecialAgentScriptLibrary.get_actor_class_names(all_actors))
+        
+        # most_common(n) is a heapq.nlargest selection; most_common() sorts everything
+        lines = [f"  {class_name}: {count}" for class_name, count in type_counts.most_common(top_n)]
         
-        for class_name, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
-            print(f"  {class_name}: {count}")
+        if top_n and len(type_counts) > top_n:
+            lines.append(f"  ... and {len(type_counts) - top_n} more types")
+        sys.stdout.write("".join(line + "\n" for line in lines))
 
 if __name__ == "__main__":
     # List all actors
@@ -0,0 +1,48 @@
+"""
+Optional Numba JIT support for the example scripts
+Numerical kernels import njit/prange from here instead of from numba directly
+"""
+
+import inspect
+import os
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+def _has_source_file(func) -> bool:
+    """True if func was defined in a file on disk (Numba can only cache those)"""
+    try:
+        return os.path.isfile(inspect.getfile(func))
+    except TypeError:
+        return False
+
+def jit_kernel(func=None, *, fastmath: bool = True):
+    """
+    Compile a numerical kernel with parallel=True and fastmath=True, plus cache=True when possible
+    
+    With Numba installed, the first call pays the compile cost and cache=True writes the
+    machine code to __pycache__ so later editor sessions load it instead of recompiling.
+    Numba can only cache functions defined in a file on disk - scripts sent as code text
+    (e.g., via execute_python) are compiled from '<string>', so they get no cache and
+    recompile on every run instead of failing. Without Numba this is a no-op and the
+    kernel runs as plain Python/NumPy.
+    
+    fastmath assumes there are no NaN/Inf values - use @jit_kernel(fastmath=False) for
+    kernels that rely on NaN comparisons.
+    """
+    if func is None:
+        return lambda f: jit_kernel(f, fastmath=fastmath)
+    if _has_source_file(func):
+        return njit(cache=True, parallel=True, fastmath=fastmath)(func)
+    return njit(parallel=True, fastmath=fastmath)(func)
@@ -4,17 +4,17 @@ Demonstrates lighting actor creation and configuration
 """
 
 import unreal
-import math
+import numpy as np
+
+editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
 
 def setup_basic_lighting():
     """Set up a basic three-point lighting setup"""
-    editor_level_lib = unreal.EditorLevelLibrary()
-    
     print("Setting up three-point lighting...")
     
     # 1. Key Light (Main directional light - Sun)
     print("\n1. Creating key light (Sun)...")
-    sun = editor_level_lib.spawn_actor_from_class(
+    sun = editor_actor_subsystem.spawn_actor_from_class(
         unreal.DirectionalLight,
         unreal.Vector(0, 0, 1000),
         unreal.Rotator(-45, 45, 0)
@@ -29,7 +29,7 @@ def setup_basic_lighting():
     
     # 2. Sky Light (Fill light)
     print("\n2. Creating sky light...")
-    sky_light = editor_level_lib.spawn_actor_from_class(
+    sky_light = editor_actor_subsystem.spawn_actor_from_class(
         unreal.SkyLight,
         unreal.Vector(0, 0, 1000),
         unreal.Rotator(0, 0, 0)
@@ -46,34 +46,31 @@ def setup_basic_lighting():
     num_accent_lights = 4
     radius = 2000.0
     
-    for i in range(num_accent_lights):
-        angle = (2 * math.pi * i) / num_accent_lights
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-        
-        point_light = editor_level_lib.spawn_actor_from_class(
-            unreal.PointLight,
-            unreal.Vector(x, y, 400),
-            unreal.Rotator(0, 0, 0)
-        )
-        
-        if point_light:
-            point_light.set_actor_label(f"AccentLight_{i}")
-            light_component = point_light.light_component
-            light_component.set_intensity(5000.0)
-            
-            # Different color for each light
-            colors = [
-                unreal.LinearColor(1.0, 0.8, 0.6, 1.0),  # Warm
-                unreal.LinearColor(0.6, 0.8, 1.0, 1.0),  # Cool
-                unreal.LinearColor(0.8, 1.0, 0.8, 1.0),  # Green
-                unreal.LinearColor(1.0, 0.8, 1.0, 1.0),  # Magenta
-            ]
-            light_component.set_light_color(colors[i % len(colors)])
-            light_component.set_attenuation_radius(1500.0)
-            light_component.set_cast_shadows(False)
+    # Different color for each light (cycled if there are more lights than colors)
+    colors = np.array([
+        (1.0, 0.8, 0.6),  # Warm
+        (0.6, 0.8, 1.0),  # Cool
+        (0.8, 1.0, 0.8),  # Green
+        (1.0, 0.8, 1.0),  # Magenta
+    ])
+    
+    # One row per light: [x, y, z, intensity, r, g, b, attenuation_radius]
+    angles = np.linspace(0, 2 * np.pi, num_accent_lights, endpoint=False)
+    specs = np.empty((num_accent_lights, 8))
+    specs[:, 0] = radius * np.cos(angles)
+    specs[:, 1] = radius * np.sin(angles)
+    specs[:, 2] = 400.0
+    specs[:, 3] = 5000.0
+    specs[:, 4:7] = colors[np.arange(num_accent_lights) % len(colors)]
+    specs[:, 7] = 1500.0
+    
+    accent_lights = unreal.SpecialAgentScriptLibrary.spawn_point_lights(
+        specs.ravel().tolist(),
+        "AccentLight",
+        False
+    )
     
-    print(f"  ✓ Created {num_accent_lights} accent lights")
+    print(f"  ✓ Created {sum(1 for light in accent_lights if light)} accent lights")
     
     print("\n✓ Lighting setup complete!")
     print("\nLighting configuration:")
@@ -4,30 +4,64 @@ Demonstrates asset discovery via Python
 """
 
 import unreal
+from collections import Counter
 
-def list_all_assets():
-    """List all assets in the project"""
+def breakdown_by_class():
+    """
+    Count assets per class without pulling every asset into Python
+    
+    Returns:
+        Counter of asset class name -> number of assets
+    """
+    histogram = unreal.SpecialAgentScriptLibrary.get_asset_class_histogram()
+    # Go through items() so the counts don't depend on how unreal.Map iterates
+    return Counter(dict(histogram.items()))
+
+def list_all_assets(class_names: list = None, top_n: int = None):
+    """
+    List assets in the project
+    
+    Args:
+        class_names: Optional asset class names to restrict the listing to (e.g., ["StaticMesh", "Material"]).
+                     Subclasses are included. When omitted, every asset in the project is counted.
+        top_n: Only show the N most common classes in the breakdown (default: show all)
+    """
     asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
     
-    # Get all assets
-    all_assets = asset_registry.get_all_assets()
+    if class_names:
+        # Only fetch the requested classes from the registry
+        assets_by_path = {}
+        for class_name in class_names:
+            for asset_data in asset_registry.get_assets_by_class(class_name, True):
+                # Overlapping classes (a parent plus its subclass) would otherwise count an asset twice
+                assets_by_path.setdefault((str(asset_data.package_name), str(asset_data.asset_name)), asset_data)
+        assets = list(assets_by_path.values())
+        
+        # Count by class
+        class_counts = Counter(str(asset_data.asset_class_path.asset_name) for asset_data in assets)
+        
+        example_assets = assets[:20]
+    else:
+        # Count by class on the C++ side
+        class_counts = breakdown_by_class()
+        
+        # Examples only need a handful of assets - C++ stops enumerating after 20
+        example_assets = unreal.SpecialAgentScriptLibrary.get_asset_samples("/Game", 20)
     
-    print(f"Total assets in project: {len(all_assets)}")
+    scope = "matching" if class_names else "in project"
+    print(f"Total assets {scope}: {sum(class_counts.values())}")
     print("\nAsset breakdown by class:")
     
-    # Count by class
-    class_counts = {}
-    for asset_data in all_assets:
-        class_name = str(asset_data.asset_class_path.asset_name)
-        class_counts[class_name] = class_counts.get(class_name, 0) + 1
-    
-    # Print sorted by count
-    for class_name, count in sorted(class_counts.items(), key=lambda x: x[1], reverse=True):
+    # Print sorted by count - with top_n this is a heap selection rather than a full sort
+    for class_name, count in class_counts.most_common(top_n):
         print(f"  {class_name}: {count}")
     
+    if top_n and len(class_counts) > top_n:
+        print(f"  ... and {len(class_counts) - top_n} more classes")
+    
     # Show some example assets
     print("\nExample assets (first 20):")
-    for i, asset_data in enumerate(all_assets[:20]):
+    for i, asset_data in enumerate(example_assets):
         asset_name = str(asset_data.asset_name)
         asset_path = asset_data.object_path
         print(f"  {i+1}. {asset_name} ({asset_data.asset_class_path.asset_name})")
@@ -35,4 +69,3 @@ def list_all_assets():
 
 if __name__ == "__main__":
     list_all_assets()
-
@@ -1,33 +1,60 @@
+import sys
 import unreal
-import random
+import numpy as np
+from itertools import compress
 
 # Use the Editor Actor Subsystem (UE 5.5 API)
 editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
 all_actors = editor_actor_subsystem.get_all_level_actors()
 
+# Every random value in this script is drawn from this generator, in bulk per tent
+rng = np.random.default_rng()
+
+# Labels containing these are large environment pieces, not props
+EXCLUDE_KEYWORDS = ('floor', 'plane', 'ground', 'landscape', 'sky', 'terrain')
+
 # Find tents and props
 tents = []
 props_with_meshes = []
 
 print("Scanning level for tents and props...")
 
-for actor in all_actors:
-    actor_label = actor.get_actor_label().lower()
-    
-    if 'tent' in actor_label:
-        tents.append(actor)
-        loc = actor.get_actor_location()
-        print(f"Found tent: {actor.get_actor_label()} at ({loc.x:.1f}, {loc.y:.1f}, {loc.z:.1f})")
-    elif isinstance(actor, unreal.StaticMeshActor):
-        # Exclude large environment pieces
-        if not any(keyword in actor_label for keyword in ['floor', 'plane', 'ground', 'landscape', 'sky', 'terrain']):
-            static_mesh_comp = actor.static_mesh_component
-            if static_mesh_comp and static_mesh_comp.static_mesh:
-                props_with_meshes.append({
-                    'actor': actor,
-                    'mesh': static_mesh_comp.static_mesh,
-                    'scale': actor.get_actor_scale3d()
-                })
+# Split tents from static mesh candidates in C++ so labels are only fetched for actors we may keep
+tent_actors = unreal.EditorFilterLibrary.by_actor_label(all_actors, 'tent')
+non_tent_actors = unreal.EditorFilterLibrary.by_actor_label(
+    all_actors, 'tent', filter_type=unreal.EditorScriptingFilterType.EXCLUDE
+)
+mesh_actors = unreal.EditorFilterLibrary.by_class(non_tent_actors, unreal.StaticMeshActor)
+
+lines = []
+for actor in tent_actors:
+    raw_label = actor.get_actor_label()
+    loc = actor.get_actor_location()
+    tents.append({
+        'actor': actor,
+        'label': raw_label,
+        'location': loc
+    })
+    lines.append(f"Found tent: {raw_label} at ({loc.x:.1f}, {loc.y:.1f}, {loc.z:.1f})")
+sys.stdout.write("".join(line + "\n" for line in lines))
+
+# Exclude large environment pieces - one label fetch and a vectorized keyword mask
+raw_labels = list(unreal.SpecialAgentScriptLibrary.get_actor_labels(mesh_actors))
+actor_labels = np.char.lower(np.array(raw_labels, dtype=str))
+excluded = np.zeros(len(actor_labels), dtype=bool)
+for keyword in EXCLUDE_KEYWORDS:
+    excluded |= np.char.find(actor_labels, keyword) >= 0
+
+# Only the survivors have their mesh and scale fetched
+for actor, raw_label in compress(zip(mesh_actors, raw_labels), ~excluded):
+    static_mesh_comp = actor.static_mesh_component
+    if static_mesh_comp and static_mesh_comp.static_mesh:
+        props_with_meshes.append({
+            'actor': actor,
+            'label': raw_label,
+            'mesh': static_mesh_comp.static_mesh,
+            'scale': actor.get_actor_scale3d()
+        })
 
 print(f"\nFound {len(tents)} tent(s) and {len(props_with_meshes)} prop(s) to use")
 
@@ -40,54 +67,50 @@ else:
     num_props_per_tent = min(8, len(props_with_meshes))  # Up to 8 props per tent
     placement_radius = 400.0  # Units around tent
     new_actors = []
+    lines = []
     
     for tent in tents:
-        tent_loc = tent.get_actor_location()
-        print(f"\nPlacing props around {tent.get_actor_label()}...")
+        tent_loc = tent['location']
+        lines.append(f"\nPlacing props around {tent['label']}...")
         
         # Select random props to place
-        selected_props = random.sample(props_with_meshes, min(num_props_per_tent, len(props_with_meshes)))
+        count = min(num_props_per_tent, len(props_with_meshes))
+        selected_props = [props_with_meshes[j] for j in rng.choice(len(props_with_meshes), size=count, replace=False)]
+        
+        # Calculate positions around tent for all props at once
+        angles = np.arange(count) * (360.0 / num_props_per_tent) + rng.uniform(-20, 20, size=count)
+        distances = rng.uniform(placement_radius * 0.6, placement_radius, size=count)
+        radians = np.deg2rad(angles)
+        offsets_x = np.cos(radians) * distances
+        offsets_y = np.sin(radians) * distances
+        scale_variations = rng.uniform(0.8, 1.2, size=(count, 1))
+        base_scales = np.array([(p['scale'].x, p['scale'].y, p['scale'].z) for p in selected_props])
+        
+        # Pack spawn records as [x, y, z, pitch, yaw, roll, scale_x, scale_y, scale_z]
+        transforms = np.zeros((count, 9))
+        transforms[:, 0] = tent_loc.x + offsets_x
+        transforms[:, 1] = tent_loc.y + offsets_y
+        transforms[:, 2] = tent_loc.z  # Keep same Z height
+        transforms[:, 4] = rng.uniform(0, 360, size=count)
+        transforms[:, 6:9] = base_scales * scale_variations  # Vary the scale slightly
+        
+        # Spawn new actors with the same meshes in one call
+        spawned = unreal.SpecialAgentScriptLibrary.spawn_static_mesh_actors(
+            [prop_data['mesh'] for prop_data in selected_props],
+            transforms.ravel().tolist(),
+            ""
+        )
+        
+        # Set descriptive labels in one call
+        new_labels = [f"Prop_{prop_data['label']}_{i}" for i, prop_data in enumerate(selected_props)]
+        unreal.SpecialAgentScriptLibrary.set_actor_labels(spawned, new_labels)
         
-        for i, prop_data in enumerate(selected_props):
-            # Calculate position around tent
-            angle = (i / num_props_per_tent) * 360.0 + random.uniform(-20, 20)
-            distance = random.uniform(placement_radius * 0.6, placement_radius)
-            
-            import math
-            offset_x = math.cos(math.radians(angle)) * distance
-            offset_y = math.sin(math.radians(angle)) * distance
-            
-            new_location = unreal.Vector(
-                tent_loc.x + offset_x,
-                tent_loc.y + offset_y,
-                tent_loc.z  # Keep same Z height
-            )
-            
-            # Spawn new actor with the same mesh
-            new_actor = editor_actor_subsystem.spawn_actor_from_class(
-                unreal.StaticMeshActor,
-                new_location,
-                unreal.Rotator(0, random.uniform(0, 360), 0)
-            )
-            
+        for i, new_actor in enumerate(spawned):
             if new_actor:
-                # Set the mesh
-                new_actor.static_mesh_component.set_static_mesh(prop_data['mesh'])
-                
-                # Vary the scale slightly
-                base_scale = prop_data['scale']
-                scale_variation = random.uniform(0.8, 1.2)
-                new_actor.set_actor_scale3d(unreal.Vector(
-                    base_scale.x * scale_variation,
-                    base_scale.y * scale_variation,
-                    base_scale.z * scale_variation
-                ))
-                
-                # Set a descriptive label
-                new_actor.set_actor_label(f"Prop_{prop_data['actor'].get_actor_label()}_{i}")
                 new_actors.append(new_actor)
-                print(f"  Placed {new_actor.get_actor_label()} at ({new_location.x:.1f}, {new_location.y:.1f})")
+                lines.append(f"  Placed {new_labels[i]} at ({transforms[i, 0]:.1f}, {transforms[i, 1]:.1f})")
     
+    sys.stdout.write("".join(line + "\n" for line in lines))
     print(f"\nSuccessfully placed {len(new_actors)} props around {len(tents)} tent(s)!")
     unreal.log("Props placed successfully around tents!")
 
@@ -4,7 +4,10 @@ Demonstrates procedural placement via Python
 """
 
 import unreal
-import random
+import numpy as np
+
+# Shared across calls so each grid draws from the same PCG64 stream
+rng = np.random.default_rng()
 
 def spawn_grid_pattern(rows: int = 5, cols: int = 5, spacing: float = 500.0):
     """
@@ -15,8 +18,6 @@ def spawn_grid_pattern(rows: int = 5, cols: int = 5, spacing: float = 500.0):
         cols: Number of columns
         spacing: Distance between actors
     """
-    editor_level_lib = unreal.EditorLevelLibrary()
-    
     # Try to find a static mesh to use
     asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
     all_meshes = asset_registry.get_assets_by_class("StaticMesh", True)
@@ -29,54 +30,35 @@ def spawn_grid_pattern(rows: int = 5, cols: int = 5, spacing: float = 500.0):
     mesh_asset = all_meshes[0]
     print(f"Using mesh: {mesh_asset.asset_name}")
     
-    spawned_count = 0
     center_offset_x = -(cols * spacing) / 2
     center_offset_y = -(rows * spacing) / 2
     
     print(f"\nSpawning {rows}x{cols} grid with {spacing} unit spacing...")
     
-    for row in range(rows):
-        for col in range(cols):
-            # Calculate position
-            x = center_offset_x + (col * spacing)
-            y = center_offset_y + (row * spacing)
-            z = 100.0  # Base height
-            
-            location = unreal.Vector(x, y, z)
-            rotation = unreal.Rotator(0, random.uniform(0, 360), 0)
-            
-            # Spawn actor
-            actor = editor_level_lib.spawn_actor_from_class(
-                unreal.StaticMeshActor,
-                location,
-                rotation
-            )
-            
-            if actor:
-                # Set the static mesh
-                static_mesh_component = actor.static_mesh_component
-                if static_mesh_component:
-                    static_mesh_component.set_static_mesh(mesh_asset.get_asset())
-                
-                # Set label
-                actor.set_actor_label(f"GridActor_{row}_{col}")
-                
-                # Random scale variation
-                scale = random.uniform(0.8, 1.2)
-                actor.set_actor_scale3d(unreal.Vector(scale, scale, scale))
-                
-                # Add tags for organization
-                actor.tags = ["Procedural", "Grid", "Example"]
-                
-                spawned_count += 1
-                
-                if spawned_count % 5 == 0:
-                    print(f"  Spawned {spawned_count} actors...")
+    # Precompute every transform as [x, y, z, pitch, yaw, roll, scale_x, scale_y, scale_z], row by row
+    count = rows * cols
+    col_index, row_index = np.meshgrid(np.arange(cols), np.arange(rows))
+    transforms = np.zeros((count, 9))
+    transforms[:, 0] = center_offset_x + col_index.ravel() * spacing
+    transforms[:, 1] = center_offset_y + row_index.ravel() * spacing
+    transforms[:, 2] = 100.0  # Base height
+    transforms[:, 4] = rng.uniform(0, 360, count)  # Random yaw
+    transforms[:, 6:9] = rng.uniform(0.8, 1.2, (count, 1))  # Random uniform scale variation
+    
+    # Spawn the whole grid in one call (and one undo step), organized under a "Grid" folder
+    actors = unreal.SpecialAgentScriptLibrary.spawn_static_mesh_actors(
+        [mesh_asset.get_asset()],
+        transforms.ravel().tolist(),
+        "Grid"
+    )
+    
+    # Set all labels in one call (actors come back in the same row-by-row order)
+    labels = [f"GridActor_{row}_{col}" for row in range(rows) for col in range(cols)]
+    spawned_count = unreal.SpecialAgentScriptLibrary.set_actor_labels(actors, labels)
     
     print(f"\n✓ Successfully spawned {spawned_count} actors in grid pattern")
-    print("Tip: Select these actors in outliner by searching for tag 'Grid'")
+    print("Tip: Find these actors in the outliner under the 'Grid' folder")
 
 if __name__ == "__main__":
     # Spawn a 10x10 grid
     spawn_grid_pattern(rows=10, cols=10, spacing=300.0)
-
@@ -4,6 +4,72 @@ Demonstrates spatial queries and raycast operations
 """
 
 import unreal
+import numpy as np
+from functools import lru_cache
+from jit_utils import HAS_NUMBA, jit_kernel, prange
+
+unreal_editor_subsystem = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
+
+@jit_kernel
+def _terrain_stats(heights):
+    """Min, max, mean and variation of a 1D array of hit heights (must not contain NaN)"""
+    lo = heights.min()
+    hi = heights.max()
+    return lo, hi, heights.mean(), hi - lo
+
+if HAS_NUMBA:
+    @jit_kernel(fastmath=False)
+    def _max_height_step(height_grid):
+        """Largest height difference between neighbouring samples; NaN (missed) samples are skipped"""
+        rows, cols = height_grid.shape
+        row_steps = np.zeros(rows)
+        for i in prange(rows):
+            steepest = 0.0
+            for j in range(cols):
+                h = height_grid[i, j]
+                # NaN compares false, so misses never win (no fastmath here for that reason)
+                if j + 1 < cols:
+                    dz = abs(height_grid[i, j + 1] - h)
+                    if dz > steepest:
+                        steepest = dz
+                if i + 1 < rows:
+                    dz = abs(height_grid[i + 1, j] - h)
+                    if dz > steepest:
+                        steepest = dz
+            row_steps[i] = steepest
+        return row_steps.max()
+else:
+    def _max_height_step(height_grid):
+        """Largest height difference between neighbouring samples; NaN (missed) samples are skipped"""
+        steepest = 0.0
+        for axis in (0, 1):
+            if height_grid.shape[axis] < 2:
+                continue
+            steps = np.abs(np.diff(height_grid, axis=axis))
+            # nanmax warns and returns NaN when every step touches a miss
+            if not np.isnan(steps).all():
+                steepest = max(steepest, float(np.nanmax(steps)))
+        return steepest
+
+def _sample_axis(lo: float, hi: float, spacing: float):
+    """Evenly spaced samples from lo up to and including hi (when it falls on the grid)"""
+    count = int(np.floor((hi - lo) / spacing)) + 1
+    return lo + spacing * np.arange(count, dtype=np.float64)
+
+@lru_cache(maxsize=8)
+def _sample_grid(bounds_min: tuple, bounds_max: tuple, sample_spacing: float):
+    """
+    Build the XY sample grid for a region, cached so repeated passes over the same region reuse it
+    
+    Returns:
+        (points_xy, shape) - the points flattened to an immutable (x0, y0, x1, y1, ...) tuple
+        ready for trace_ground_heights, and the grid's (rows, cols)
+    """
+    xs = _sample_axis(bounds_min[0], bounds_max[0], sample_spacing)
+    ys = _sample_axis(bounds_min[1], bounds_max[1], sample_spacing)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    points_xy = np.column_stack((grid_x.ravel(), grid_y.ravel()))
+    return tuple(points_xy.ravel().tolist()), grid_x.shape
 
 def analyze_terrain(bounds_min: tuple = (-5000, -5000), 
                    bounds_max: tuple = (5000, 5000),
@@ -16,7 +82,7 @@ def analyze_terrain(bounds_min: tuple = (-5000, -5000),
         bounds_max: Maximum (X, Y) coordinates
         sample_spacing: Distance between sample points
     """
-    world = unreal.EditorLevelLibrary.get_editor_world()
+    world = unreal_editor_subsystem.get_editor_world()
     
     if not world:
         print("No editor world found!")
@@ -25,54 +91,32 @@ def analyze_terrain(bounds_min: tuple = (-5000, -5000),
     print(f"Analyzing terrain from {bounds_min} to {bounds_max}")
     print(f"Sample spacing: {sample_spacing}")
     
-    heights = []
-    sample_count = 0
-    hit_count = 0
+    # Build (or reuse) the whole sample grid at once, flattened to [x0, y0, x1, y1, ...]
+    points_xy, grid_shape = _sample_grid(tuple(bounds_min), tuple(bounds_max), sample_spacing)
     
-    min_x, min_y = bounds_min
-    max_x, max_y = bounds_max
+    # Raycast from above to find ground - all points in a single call
+    heights = np.asarray(
+        unreal.SpecialAgentScriptLibrary.trace_ground_heights(world, points_xy, 5000.0, -5000.0),
+        dtype=np.float64
+    )
     
-    # Sample points
-    x = min_x
-    while x <= max_x:
-        y = min_y
-        while y <= max_y:
-            # Raycast from above to find ground
-            start = unreal.Vector(x, y, 5000.0)
-            end = unreal.Vector(x, y, -5000.0)
-            
-            hit_result = unreal.SystemLibrary.line_trace_single(
-                world,
-                start,
-                end,
-                unreal.TraceTypeQuery.TRACE_TYPE_QUERY1,
-                False,
-                [],
-                unreal.DrawDebugTrace.NONE,
-                unreal.HitResult(),
-                True
-            )
-            
-            sample_count += 1
-            
-            if hit_result:
-                # Get hit result (need to access via proper method)
-                # This is simplified - actual implementation would need proper hit result access
-                # For now, just track that we got a hit
-                hit_count += 1
-            
-            y += sample_spacing
-        x += sample_spacing
+    sample_count = len(points_xy) // 2
+    hits = heights[~np.isnan(heights)]
     
     print(f"\nSampled {sample_count} points")
-    print(f"Hits: {hit_count}")
+    print(f"Hits: {len(hits)}")
     
-    if heights:
+    if hits.size:
+        min_height, max_height, avg_height, variation = _terrain_stats(hits)
+        max_step = _max_height_step(heights.reshape(grid_shape))
+        max_slope = np.degrees(np.arctan(max_step / sample_spacing))
+        
         print(f"\nTerrain height statistics:")
-        print(f"  Min height: {min(heights):.1f}")
-        print(f"  Max height: {max(heights):.1f}")
-        print(f"  Avg height: {sum(heights)/len(heights):.1f}")
-        print(f"  Height variation: {max(heights) - min(heights):.1f}")
+        print(f"  Min height: {min_height:.1f}")
+        print(f"  Max height: {max_height:.1f}")
+        print(f"  Avg height: {avg_height:.1f}")
+        print(f"  Height variation: {variation:.1f}")
+        print(f"  Max slope between samples: {max_slope:.1f} degrees")
 
 if __name__ == "__main__":
     analyze_terrain(
@@ -80,4 +124,3 @@ if __name__ == "__main__":
         bounds_max=(2000, 2000),
         sample_spacing=500.0
     )
-
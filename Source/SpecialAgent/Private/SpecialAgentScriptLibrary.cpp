@@ -0,0 +1,300 @@
+// Copyright Epic Games, Inc. All Rights Reserved.
+// SpecialAgentScriptLibrary Implementation - Batched helpers for editor Python scripts
+
+#include "SpecialAgentScriptLibrary.h"
+#include "GameFramework/Actor.h"
+#include "Engine/Engine.h"
+#include "Engine/World.h"
+#include "AssetRegistry/AssetRegistryModule.h"
+#include "AssetRegistry/IAssetRegistry.h"
+#include "Editor.h"
+#include "ScopedTransaction.h"
+#include "Components/StaticMeshComponent.h"
+#include "Engine/StaticMeshActor.h"
+#include "Engine/StaticMesh.h"
+#include "Engine/PointLight.h"
+#include "Components/PointLightComponent.h"
+
+TArray<FString> USpecialAgentScriptLibrary::GetActorLabels(const TArray<AActor*>& Actors)
+{
+	TArray<FString> Labels;
+	Labels.Reserve(Actors.Num());
+
+	for (const AActor* Actor : Actors)
+	{
+		Labels.Add(Actor ? Actor->GetActorLabel() : FString());
+	}
+
+	return Labels;
+}
+
+TArray<FString> USpecialAgentScriptLibrary::GetActorClassNames(const TArray<AActor*>& Actors)
+{
+	TArray<FString> ClassNames;
+	ClassNames.Reserve(Actors.Num());
+
+	for (const AActor* Actor : Actors)
+	{
+		ClassNames.Add(Actor ? Actor->GetClass()->GetName() : FString());
+	}
+
+	return ClassNames;
+}
+
+TArray<float> USpecialAgentScriptLibrary::TraceGroundHeights(const UObject* WorldContextObject, const TArray<float>& PointsXY, float TraceTopZ, float TraceBottomZ)
+{
+	TArray<float> Heights;
+
+	UWorld* World = GEngine->GetWorldFromContextObject(WorldContextObject, EGetWorldErrorMode::LogAndReturnNull);
+	if (!World)
+	{
+		return Heights;
+	}
+
+	if (PointsXY.Num() % 2 != 0)
+	{
+		UE_LOG(LogTemp, Warning, TEXT("SpecialAgent: TraceGroundHeights expects [X, Y] pairs, got %d values"), PointsXY.Num());
+		return Heights;
+	}
+
+	const int32 NumPoints = PointsXY.Num() / 2;
+	Heights.Reserve(NumPoints);
+
+	FCollisionQueryParams QueryParams(SCENE_QUERY_STAT(SpecialAgentTraceGroundHeights), /*bTraceComplex=*/ false);
+	FHitResult Hit;
+
+	for (int32 Index = 0; Index < NumPoints; ++Index)
+	{
+		const float X = PointsXY[Index * 2];
+		const float Y = PointsXY[Index * 2 + 1];
+
+		const bool bHit = World->LineTraceSingleByChannel(
+			Hit,
+			FVector(X, Y, TraceTopZ),
+			FVector(X, Y, TraceBottomZ),
+			ECC_Visibility,
+			QueryParams
+		);
+
+		Heights.Add(bHit ? Hit.ImpactPoint.Z : NAN);
+	}
+
+	return Heights;
+}
+
+TMap<FString, int32> USpecialAgentScriptLibrary::GetAssetClassHistogram()
+{
+	IAssetRegistry& AssetRegistry = FModuleManager::LoadModuleChecked<FAssetRegistryModule>("AssetRegistry").Get();
+
+	TArray<FAssetData> AssetDataList;
+	AssetRegistry.GetAllAssets(AssetDataList);
+
+	// Tally on FName to keep the hot loop free of string work
+	TMap<FName, int32> CountsByName;
+	for (const FAssetData& AssetData : AssetDataList)
+	{
+		CountsByName.FindOrAdd(AssetData.AssetClassPath.GetAssetName())++;
+	}
+
+	TMap<FString, int32> Histogram;
+	Histogram.Reserve(CountsByName.Num());
+	for (const TPair<FName, int32>& Pair : CountsByName)
+	{
+		Histogram.Add(Pair.Key.ToString(), Pair.Value);
+	}
+
+	return Histogram;
+}
+
+TArray<FAssetData> USpecialAgentScriptLibrary::GetAssetSamples(FName PackagePath, int32 MaxExamples)
+{
+	TArray<FAssetData> Samples;
+	if (MaxExamples <= 0)
+	{
+		return Samples;
+	}
+
+	IAssetRegistry& AssetRegistry = FModuleManager::LoadModuleChecked<FAssetRegistryModule>("AssetRegistry").Get();
+
+	FARFilter Filter;
+	Filter.PackagePaths.Add(PackagePath);
+	Filter.bRecursivePaths = true;
+
+	Samples.Reserve(MaxExamples);
+	AssetRegistry.EnumerateAssets(Filter, [&Samples, MaxExamples](const FAssetData& AssetData)
+	{
+		Samples.Add(AssetData);
+		return Samples.Num() < MaxExamples;  // Returning false stops the enumeration
+	});
+
+	return Samples;
+}
+
+TArray<AActor*> USpecialAgentScriptLibrary::SpawnStaticMeshActors(const TArray<UStaticMesh*>& StaticMeshes, const TArray<float>& Transforms, FName FolderPath)
+{
+	static constexpr int32 RecordSize = 9;
+
+	TArray<AActor*> SpawnedActors;
+
+	UWorld* World = GEditor ? GEditor->GetEditorWorldContext().World() : nullptr;
+	if (!World)
+	{
+		return SpawnedActors;
+	}
+
+	if (Transforms.Num() % RecordSize != 0)
+	{
+		UE_LOG(LogTemp, Warning, TEXT("SpecialAgent: SpawnStaticMeshActors expects %d floats per actor, got %d values"), RecordSize, Transforms.Num());
+		return SpawnedActors;
+	}
+
+	const int32 NumActors = Transforms.Num() / RecordSize;
+	const bool bSharedMesh = StaticMeshes.Num() == 1;
+	if (!bSharedMesh && StaticMeshes.Num() != NumActors)
+	{
+		UE_LOG(LogTemp, Warning, TEXT("SpecialAgent: SpawnStaticMeshActors expects 1 or %d meshes, got %d"), NumActors, StaticMeshes.Num());
+		return SpawnedActors;
+	}
+
+	SpawnedActors.Reserve(NumActors);
+
+	FScopedTransaction Transaction(NSLOCTEXT("SpecialAgent", "SpawnStaticMeshActors", "Spawn Static Mesh Actors"));
+
+	int32 SpawnedCount = 0;
+	FActorSpawnParameters SpawnParams;
+	SpawnParams.OverrideLevel = World->GetCurrentLevel();
+	SpawnParams.ObjectFlags |= RF_Transactional;
+
+	for (int32 Index = 0; Index < NumActors; ++Index)
+	{
+		UStaticMesh* StaticMesh = StaticMeshes[bSharedMesh ? 0 : Index];
+		if (!StaticMesh)
+		{
+			SpawnedActors.Add(nullptr);
+			continue;
+		}
+
+		const float* Record = &Transforms[Index * RecordSize];
+		const FVector Location(Record[0], Record[1], Record[2]);
+
+		// Spawn with zero rotation and apply it afterwards, matching world/spawn_actor
+		AStaticMeshActor* MeshActor = World->SpawnActor<AStaticMeshActor>(
+			AStaticMeshActor::StaticClass(),
+			Location,
+			FRotator::ZeroRotator,
+			SpawnParams
+		);
+
+		if (!MeshActor)
+		{
+			SpawnedActors.Add(nullptr);
+			continue;
+		}
+
+		if (UStaticMeshComponent* MeshComp = MeshActor->GetStaticMeshComponent())
+		{
+			MeshComp->SetStaticMesh(StaticMesh);
+		}
+
+		MeshActor->SetActorRotation(FRotator(Record[3], Record[4], Record[5]));
+		MeshActor->SetActorScale3D(FVector(Record[6], Record[7], Record[8]));
+
+		if (!FolderPath.IsNone())
+		{
+			MeshActor->SetFolderPath(FolderPath);
+		}
+
+		SpawnedActors.Add(MeshActor);
+		SpawnedCount++;
+	}
+
+	UE_LOG(LogTemp, Log, TEXT("SpecialAgent: Spawned %d/%d static mesh actors"), SpawnedCount, NumActors);
+
+	return SpawnedActors;
+}
+
+int32 USpecialAgentScriptLibrary::SetActorLabels(const TArray<AActor*>& Actors, const TArray<FString>& Labels)
+{
+	if (Actors.Num() != Labels.Num())
+	{
+		UE_LOG(LogTemp, Warning, TEXT("SpecialAgent: SetActorLabels got %d actors but %d labels"), Actors.Num(), Labels.Num());
+		return 0;
+	}
+
+	FScopedTransaction Transaction(NSLOCTEXT("SpecialAgent", "SetActorLabels", "Set Actor Labels"));
+
+	int32 LabelledCount = 0;
+	for (int32 Index = 0; Index < Actors.Num(); ++Index)
+	{
+		if (AActor* Actor = Actors[Index])
+		{
+			Actor->SetActorLabel(Labels[Index]);
+			LabelledCount++;
+		}
+	}
+
+	return LabelledCount;
+}
+
+TArray<AActor*> USpecialAgentScriptLibrary::SpawnPointLights(const TArray<float>& Specs, const FString& LabelPrefix, bool bCastShadows)
+{
+	static constexpr int32 RecordSize = 8;
+
+	TArray<AActor*> SpawnedLights;
+
+	UWorld* World = GEditor ? GEditor->GetEditorWorldContext().World() : nullptr;
+	if (!World)
+	{
+		return SpawnedLights;
+	}
+
+	if (Specs.Num() % RecordSize != 0)
+	{
+		UE_LOG(LogTemp, Warning, TEXT("SpecialAgent: SpawnPointLights expects %d floats per light, got %d values"), RecordSize, Specs.Num());
+		return SpawnedLights;
+	}
+
+	const int32 NumLights = Specs.Num() / RecordSize;
+	SpawnedLights.Reserve(NumLights);
+
+	FScopedTransaction Transaction(NSLOCTEXT("SpecialAgent", "SpawnPointLights", "Spawn Point Lights"));
+
+	FActorSpawnParameters SpawnParams;
+	SpawnParams.OverrideLevel = World->GetCurrentLevel();
+	SpawnParams.ObjectFlags |= RF_Transactional;
+
+	for (int32 Index = 0; Index < NumLights; ++Index)
+	{
+		const float* Record = &Specs[Index * RecordSize];
+
+		APointLight* Light = World->SpawnActor<APointLight>(
+			APointLight::StaticClass(),
+			FVector(Record[0], Record[1], Record[2]),
+			FRotator::ZeroRotator,
+			SpawnParams
+		);
+
+		if (!Light)
+		{
+			SpawnedLights.Add(nullptr);
+			continue;
+		}
+
+		if (UPointLightComponent* LightComp = Cast<UPointLightComponent>(Light->GetLightComponent()))
+		{
+			LightComp->SetIntensity(Record[3]);
+			LightComp->SetLightColor(FLinearColor(Record[4], Record[5], Record[6], 1.0f));
+			LightComp->SetAttenuationRadius(Record[7]);
+			LightComp->SetCastShadows(bCastShadows);
+		}
+
+		if (!LabelPrefix.IsEmpty())
+		{
+			Light->SetActorLabel(FString::Printf(TEXT("%s_%d"), *LabelPrefix, Index));
+		}
+
+		SpawnedLights.Add(Light);
+	}
+
+	return SpawnedLights;
+}
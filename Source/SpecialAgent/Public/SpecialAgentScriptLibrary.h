@@ -0,0 +1,93 @@
+// Copyright Epic Games, Inc. All Rights Reserved.
+
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Kismet/BlueprintFunctionLibrary.h"
+#include "AssetRegistry/AssetData.h"
+#include "SpecialAgentScriptLibrary.generated.h"
+
+/**
+ * SpecialAgent Script Library
+ * 
+ * Batched helpers for editor Python scripts (exposed as unreal.SpecialAgentScriptLibrary).
+ * Each function does its work in a single Python -> C++ call instead of one call per actor.
+ */
+UCLASS()
+class SPECIALAGENT_API USpecialAgentScriptLibrary : public UBlueprintFunctionLibrary
+{
+	GENERATED_BODY()
+
+public:
+	/**
+	 * Get the editor labels of a list of actors
+	 * @param Actors The actors to query
+	 * @return One label per actor, in the same order (empty string for invalid actors)
+	 */
+	UFUNCTION(BlueprintCallable, Category = "SpecialAgent|Scripting")
+	static TArray<FString> GetActorLabels(const TArray<AActor*>& Actors);
+
+	/**
+	 * Get the class names of a list of actors
+	 * @param Actors The actors to query
+	 * @return One class name per actor, in the same order (empty string for invalid actors)
+	 */
+	UFUNCTION(BlueprintCallable, Category = "SpecialAgent|Scripting")
+	static TArray<FString> GetActorClassNames(const TArray<AActor*>& Actors);
+
+	/**
+	 * Trace straight down at a set of XY points and return the ground height at each
+	 * @param WorldContextObject World to trace in
+	 * @param PointsXY Flattened sample points [X0, Y0, X1, Y1, ...]
+	 * @param TraceTopZ Z height each trace starts from
+	 * @param TraceBottomZ Z height each trace ends at
+	 * @return One hit Z per point, in the same order (NaN where the trace hit nothing)
+	 */
+	UFUNCTION(BlueprintCallable, Category = "SpecialAgent|Scripting", meta = (WorldContext = "WorldContextObject"))
+	static TArray<float> TraceGroundHeights(const UObject* WorldContextObject, const TArray<float>& PointsXY, float TraceTopZ, float TraceBottomZ);
+
+	/**
+	 * Count the assets in the asset registry by class
+	 * @return Map of asset class name to number of assets of that class
+	 */
+	UFUNCTION(BlueprintCallable, Category = "SpecialAgent|Scripting")
+	static TMap<FString, int32> GetAssetClassHistogram();
+
+	/**
+	 * Get the first few assets under a content path without enumerating the rest
+	 * @param PackagePath Content path to search recursively (e.g., /Game)
+	 * @param MaxExamples Maximum number of assets to return
+	 * @return Up to MaxExamples assets from the path
+	 */
+	UFUNCTION(BlueprintCallable, Category = "SpecialAgent|Scripting")
+	static TArray<FAssetData> GetAssetSamples(FName PackagePath, int32 MaxExamples);
+
+	/**
+	 * Spawn static mesh actors in the editor world as a single undo transaction
+	 * @param StaticMeshes Either one mesh shared by every actor, or one mesh per record
+	 * @param Transforms Flattened spawn records, 9 floats each: [X, Y, Z, Pitch, Yaw, Roll, ScaleX, ScaleY, ScaleZ]
+	 * @param FolderPath Optional outliner folder to place the actors in
+	 * @return One actor per record, in the same order (None where spawning failed)
+	 */
+	UFUNCTION(BlueprintCallable, Category = "SpecialAgent|Scripting")
+	static TArray<AActor*> SpawnStaticMeshActors(const TArray<UStaticMesh*>& StaticMeshes, const TArray<float>& Transforms, FName FolderPath);
+
+	/**
+	 * Set the editor labels of a list of actors as a single undo transaction
+	 * @param Actors The actors to rename (None entries are skipped)
+	 * @param Labels One label per actor, in the same order
+	 * @return Number of actors that were relabelled
+	 */
+	UFUNCTION(BlueprintCallable, Category = "SpecialAgent|Scripting")
+	static int32 SetActorLabels(const TArray<AActor*>& Actors, const TArray<FString>& Labels);
+
+	/**
+	 * Spawn and configure point lights in the editor world as a single undo transaction
+	 * @param Specs Flattened light records, 8 floats each: [X, Y, Z, Intensity, R, G, B, AttenuationRadius]
+	 * @param LabelPrefix Optional label prefix; lights are labelled Prefix_0, Prefix_1, ...
+	 * @param bCastShadows Whether the lights cast shadows
+	 * @return One light per record, in the same order (None where spawning failed)
+	 */
+	UFUNCTION(BlueprintCallable, Category = "SpecialAgent|Scripting")
+	static TArray<AActor*> SpawnPointLights(const TArray<float>& Specs, const FString& LabelPrefix, bool bCastShadows);
+};